@@ -0,0 +1,14 @@
+-- Reject overlapping availability slots per user at the database level.
+-- The GiST-backed exclusion constraint does the range-intersection check in
+-- O(log N), replacing any application-side fetch-and-scan of a user's slots.
+-- tsrange (not tstzrange): Prisma DateTime columns are timestamp(3) without
+-- time zone, and the timestamp -> timestamptz cast is not IMMUTABLE, so it
+-- cannot be used in an index expression.
+CREATE EXTENSION IF NOT EXISTS btree_gist;
+
+ALTER TABLE "AvailabilitySlot"
+    ADD CONSTRAINT "no_overlap"
+    EXCLUDE USING gist (
+        "userId" WITH =,
+        tsrange("startTime", "endTime") WITH &&
+    );
@@ -1,18 +1,25 @@
 from datetime import datetime
+from enum import Enum
 from typing import Optional
 
 import prisma
-import prisma.models
+import prisma.errors
 from fastapi import HTTPException
 from pydantic import BaseModel
 
+from project.database import db_client
 
-class AvailabilityStatus(BaseModel):
+
+class AvailabilityStatus(str, Enum):
     """
     Enumerated type representing possible statuses of an availability slot such as AVAILABLE, UNAVAILABLE, IN_A_MEETING, ON_A_BREAK, EMERGENCY_ONLY, reflecting the db enum 'AvailabilityStatus'.
     """
 
-    pass
+    AVAILABLE = "AVAILABLE"
+    UNAVAILABLE = "UNAVAILABLE"
+    IN_A_MEETING = "IN_A_MEETING"
+    ON_A_BREAK = "ON_A_BREAK"
+    EMERGENCY_ONLY = "EMERGENCY_ONLY"
 
 
 class AddAvailabilityResponse(BaseModel):
@@ -43,19 +50,28 @@ async def add_availability(
     Raises:
         HTTPException: If the user does not exist, or the availability slot times are invalid.
     """
-    user = await prisma.models.User.prisma().find_unique(where={"id": userId})
-    if not user:
-        raise HTTPException(status_code=404, detail=f"User with ID {userId} not found.")
     if startTime >= endTime:
-        return AddAvailabilityResponse(
+        return AddAvailabilityResponse.model_construct(
             message="Failure", error="Start time must be before end time."
         )
-    new_slot = await prisma.models.AvailabilitySlot.prisma().create(
-        data={
-            "userId": userId,
-            "startTime": startTime,
-            "endTime": endTime,
-            "status": status,
-        }
+    try:
+        new_slot = await db_client.availabilityslot.create(
+            data={
+                "userId": userId,
+                "startTime": startTime,
+                "endTime": endTime,
+                "status": status.value,
+            }
+        )
+    except prisma.errors.ForeignKeyViolationError:
+        raise HTTPException(status_code=404, detail=f"User with ID {userId} not found.")
+    except prisma.errors.PrismaError as error:
+        if "no_overlap" in str(error):
+            return AddAvailabilityResponse.model_construct(
+                message="Failure",
+                error="Slot overlaps an existing availability slot.",
+            )
+        raise
+    return AddAvailabilityResponse.model_construct(
+        message="Success", availabilitySlotId=new_slot.id
     )
-    return AddAvailabilityResponse(message="Success", availabilitySlotId=new_slot.id)
@@ -13,6 +13,16 @@ class ConnectCalendarServiceOutput(BaseModel):
     serviceAccountId: Optional[str] = None
 
 
+# Placeholder provider table until the real OAuth exchange is wired up. When it
+# is, perform the token POST through the shared aiohttp session owned by
+# sync_calendar_events_service rather than a client per request, so TLS
+# sessions are reused instead of re-handshaken on every connect.
+_PROVIDERS = {
+    "Google": "google-service-account-id",
+    "Outlook": "outlook-service-account-id",
+}
+
+
 async def connect_calendar_service(
     userId: str, serviceProvider: str, authorizationToken: str
 ) -> ConnectCalendarServiceOutput:
@@ -37,18 +47,13 @@ async def connect_calendar_service(
         connect_calendar_service(userId, serviceProvider, authorizationToken)
         > ConnectCalendarServiceOutput(success=True, message='Successfully connected to Google Calendar.', serviceAccountId='google-service-account-id')
     """
-    if serviceProvider == "Google" and authorizationToken:
-        serviceAccountId = "google-service-account-id"
-        message = f"Successfully connected to {serviceProvider} Calendar."
-        success = True
-    elif serviceProvider == "Outlook" and authorizationToken:
-        serviceAccountId = "outlook-service-account-id"
+    serviceAccountId = _PROVIDERS.get(serviceProvider) if authorizationToken else None
+    if serviceAccountId:
         message = f"Successfully connected to {serviceProvider} Calendar."
-        success = True
     else:
-        serviceAccountId = None
         message = "Failed to connect to the calendar service. Please check the service provider or authorization token."
-        success = False
-    return ConnectCalendarServiceOutput(
-        success=success, message=message, serviceAccountId=serviceAccountId
+    return ConnectCalendarServiceOutput.model_construct(
+        success=serviceAccountId is not None,
+        message=message,
+        serviceAccountId=serviceAccountId,
     )
@@ -2,9 +2,10 @@ from datetime import datetime
 
 import prisma
 import prisma.enums
-import prisma.models
 from pydantic import BaseModel
 
+from project.database import db_client
+
 
 class UserProfileResponse(BaseModel):
     """
@@ -43,12 +44,12 @@ async def create_profile(
     Raises:
         ValueError: If the email address is already associated with another user.
     """
-    existing_profile = await prisma.models.Profile.prisma().find_first(
-        where={"User": {"email": email}}
+    existing = await db_client.profile.count(
+        where={"User": {"email": email}}, take=1
     )
-    if existing_profile:
+    if existing:
         raise ValueError("The email address is already associated with another user.")
-    new_profile = await prisma.models.Profile.prisma().create(
+    new_profile = await db_client.profile.create(
         data={
             "firstName": firstName,
             "lastName": lastName,
@@ -56,7 +57,7 @@ async def create_profile(
             "User": {"connect": {"id": userId}},
         }
     )
-    response = UserProfileResponse(
+    response = UserProfileResponse.model_construct(
         profileId=new_profile.id,
         userId=userId,
         createdAt=new_profile.createdAt,
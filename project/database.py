@@ -0,0 +1,29 @@
+import os
+from typing import Optional
+
+from prisma import Prisma
+
+
+def _datasource_url() -> Optional[str]:
+    """
+    Returns DATABASE_URL with pool tuning applied if none is present.
+
+    connection_limit and pool_timeout bound the query engine's pool so bursts
+    queue briefly instead of serializing on connection checkout; deployments
+    that already tune the URL (e.g. docker-compose, PgBouncer setups) are left
+    untouched.
+    """
+    url = os.environ.get("DATABASE_URL")
+    if not url or "connection_limit" in url:
+        return url
+    separator = "&" if "?" in url else "?"
+    return f"{url}{separator}connection_limit=20&pool_timeout=10"
+
+
+_url = _datasource_url()
+
+# Single shared Prisma client, connected/disconnected by the FastAPI lifespan
+# in server.py. Services call its model accessors directly (db_client.user,
+# db_client.availabilityslot, ...) instead of going through the auto_register
+# registry lookup that prisma.models.X.prisma() performs on every query.
+db_client = Prisma(datasource={"url": _url} if _url else None)
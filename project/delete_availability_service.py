@@ -1,7 +1,7 @@
-import prisma
-import prisma.models
 from pydantic import BaseModel
 
+from project.database import db_client
+
 
 class DeleteAvailabilityResponse(BaseModel):
     """
@@ -23,14 +23,14 @@ async def delete_availability(slotId: str, userId: str) -> DeleteAvailabilityRes
     Returns:
         DeleteAvailabilityResponse: Response model for the deletion of an availability slot. Indicates success or failure and includes a message for context.
     """
-    slot = await prisma.models.AvailabilitySlot.prisma().find_unique(
-        where={"id": slotId, "userId": userId}
+    slot = await db_client.availabilityslot.find_unique(
+        where={"id": slotId}
     )
-    if not slot:
-        return DeleteAvailabilityResponse(
+    if not slot or slot.userId != userId:
+        return DeleteAvailabilityResponse.model_construct(
             success=False, message="Availability slot not found or unauthorized action."
         )
-    await prisma.models.AvailabilitySlot.prisma().delete(where={"id": slotId})
-    return DeleteAvailabilityResponse(
+    await db_client.availabilityslot.delete(where={"id": slotId})
+    return DeleteAvailabilityResponse.model_construct(
         success=True, message="Availability slot successfully deleted."
     )
@@ -1,7 +1,11 @@
 import prisma
-import prisma.models
+import prisma.errors
 from pydantic import BaseModel
 
+from project.database import db_client
+from project.login_service import invalidate_cached_user
+from project.view_profile_service import invalidate_cached_profile
+
 
 class DeleteUserProfileResponse(BaseModel):
     """
@@ -28,13 +32,15 @@ async def delete_profile(userId: str) -> DeleteUserProfileResponse:
         indicating success or providing error details.
     """
     try:
-        await prisma.models.User.prisma().delete(where={"id": userId})
-        return DeleteUserProfileResponse(
-            success=True,
-            message=f"User profile with ID {userId} has been successfully deleted.",
-        )
-    except Exception as error:
-        return DeleteUserProfileResponse(
+        deleted_user = await db_client.user.delete(where={"id": userId})
+    except prisma.errors.RecordNotFoundError:
+        return DeleteUserProfileResponse.model_construct(
             success=False,
-            message=f"Failed to delete user profile with ID {userId}. Error: {str(error)}",
+            message=f"User profile with ID {userId} was not found.",
         )
+    invalidate_cached_profile(userId)
+    invalidate_cached_user(deleted_user.email)
+    return DeleteUserProfileResponse.model_construct(
+        success=True,
+        message=f"User profile with ID {userId} has been successfully deleted.",
+    )
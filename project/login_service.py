@@ -1,13 +1,20 @@
-from datetime import datetime, timedelta
+import asyncio
+import base64
+import hashlib
+import hmac
+import os
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
 from typing import Union
 
-import prisma
-import prisma.models
+import orjson
 from fastapi import HTTPException
-from jose import jwt
 from passlib.context import CryptContext
 from pydantic import BaseModel
 
+from project.database import db_client
+
 
 class LoginResponse(BaseModel):
     """
@@ -20,12 +27,82 @@ class LoginResponse(BaseModel):
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
-SECRET_KEY = "a very secretive secret key"
+SECRET_KEY = os.environ.get("SECRET_KEY", "a very secretive secret key")
+
+SECRET_KEY_BYTES = SECRET_KEY.encode("utf-8")
 
 ALGORITHM = "HS256"
 
+_JWT_HEADER_B64 = base64.urlsafe_b64encode(b'{"alg":"HS256","typ":"JWT"}').rstrip(b"=")
+
+_HMAC_TEMPLATE = hmac.new(SECRET_KEY_BYTES, digestmod=hashlib.sha256)
+
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 
+USER_CACHE_TTL_SECONDS = 60
+
+USER_CACHE_MAX = 10000
+
+_user_cache: OrderedDict = OrderedDict()
+
+_user_email_by_id: dict = {}
+
+
+def invalidate_cached_user(email: str) -> None:
+    """
+    Drops the cached user row for an email after the account changes or is deleted.
+
+    Args:
+        email (str): The email address whose cache entry should be removed.
+    """
+    entry = _user_cache.pop(email, None)
+    if entry is not None:
+        _user_email_by_id.pop(entry[1].id, None)
+
+
+def invalidate_cached_user_by_id(user_id: str) -> None:
+    """
+    Drops the cached user row for a user id, for writers that don't know the
+    cached email (e.g. an email change, where the entry is keyed by the old
+    address).
+
+    Args:
+        user_id (str): The id of the user whose cache entry should be removed.
+    """
+    email = _user_email_by_id.pop(user_id, None)
+    if email is not None:
+        _user_cache.pop(email, None)
+
+
+async def _find_user_by_email(email: str):
+    """
+    Looks up a user by email, serving repeat lookups from a short-lived cache.
+
+    User rows change infrequently relative to how often they are read during
+    authentication, so cache-hot logins skip the database round-trip entirely.
+    Writers that change or remove an account call invalidate_cached_user so a
+    stale row cannot outlive the change.
+
+    Args:
+        email (str): The email address to look the user up by.
+
+    Returns:
+        The matching prisma.models.User, or None if no user exists.
+    """
+    cached = _user_cache.get(email)
+    now = time.monotonic()
+    if cached is not None and now - cached[0] < USER_CACHE_TTL_SECONDS:
+        return cached[1]
+    user = await db_client.user.find_unique(where={"email": email})
+    if user is not None:
+        _user_cache[email] = (now, user)
+        _user_cache.move_to_end(email)
+        _user_email_by_id[user.id] = email
+        while len(_user_cache) > USER_CACHE_MAX:
+            _, (_, evicted) = _user_cache.popitem(last=False)
+            _user_email_by_id.pop(evicted.id, None)
+    return user
+
 
 def create_access_token(
     data: dict, expires_delta: Union[timedelta, None] = None
@@ -41,13 +118,18 @@ def create_access_token(
         str: Generated access token.
     """
     to_encode = data.copy()
+    now = int(time.time())
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        expire = now + int(expires_delta.total_seconds())
     else:
-        expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-    to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
-    return encoded_jwt
+        expire = now + ACCESS_TOKEN_EXPIRE_MINUTES * 60
+    to_encode["exp"] = expire
+    payload_b64 = base64.urlsafe_b64encode(orjson.dumps(to_encode)).rstrip(b"=")
+    signing_input = _JWT_HEADER_B64 + b"." + payload_b64
+    digest = _HMAC_TEMPLATE.copy()
+    digest.update(signing_input)
+    signature_b64 = base64.urlsafe_b64encode(digest.digest()).rstrip(b"=")
+    return (signing_input + b"." + signature_b64).decode("ascii")
 
 
 def verify_password(plain_password, hashed_password):
@@ -81,13 +163,14 @@ async def login(email: str, password: str) -> LoginResponse:
     Raises:
         HTTPException: With status code 401 for unauthorized access attempts.
     """
-    user = await prisma.models.User.prisma().find_unique(where={"email": email})
-    if not user or not verify_password(password, user.hashedPassword):
+    user = await _find_user_by_email(email)
+    if not user or not await asyncio.to_thread(
+        verify_password, password, user.hashedPassword
+    ):
         raise HTTPException(status_code=401, detail="Incorrect email or password")
-    access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-    access_token = create_access_token(
-        data={"sub": user.email}, expires_delta=access_token_expires
-    )
-    return LoginResponse(
-        session_token=access_token, expires_at=datetime.utcnow() + access_token_expires
+    expires_at = int(time.time()) + ACCESS_TOKEN_EXPIRE_MINUTES * 60
+    access_token = create_access_token(data={"sub": user.email})
+    return LoginResponse.model_construct(
+        session_token=access_token,
+        expires_at=datetime.fromtimestamp(expires_at, tz=timezone.utc),
     )
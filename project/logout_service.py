@@ -1,7 +1,48 @@
-import prisma
-import prisma.models
+import time
+from collections import OrderedDict
+
 from pydantic import BaseModel
 
+from project.database import db_client
+
+INVALID_TOKEN_TTL_SECONDS = 60
+
+INVALID_TOKEN_CACHE_MAX = 10000
+
+_invalid_tokens: OrderedDict = OrderedDict()
+
+
+def _is_known_invalid(session_token: str) -> bool:
+    """
+    Checks whether a token recently failed logout, without touching the database.
+
+    Args:
+        session_token (str): The token to check.
+
+    Returns:
+        bool: True if the token failed within the TTL window.
+    """
+    seen_at = _invalid_tokens.get(session_token)
+    if seen_at is None:
+        return False
+    if time.monotonic() - seen_at >= INVALID_TOKEN_TTL_SECONDS:
+        del _invalid_tokens[session_token]
+        return False
+    return True
+
+
+def _remember_invalid(session_token: str) -> None:
+    """
+    Records a token that failed logout so repeat attempts skip the database.
+
+    Args:
+        session_token (str): The token that was not a valid, active session.
+    """
+    _invalid_tokens[session_token] = time.monotonic()
+    _invalid_tokens.move_to_end(session_token)
+    while len(_invalid_tokens) > INVALID_TOKEN_CACHE_MAX:
+        _invalid_tokens.popitem(last=False)
+
 
 class LogoutResponse(BaseModel):
     """
@@ -16,8 +57,9 @@ async def logout(session_token: str) -> LogoutResponse:
     """
     Invalidates the user's current session token.
 
-    This function looks up the session matching the provided token in the database and sets its valid field to False,
-    effectively invalidating the session. It handles the case where the session token is not found or already invalid.
+    This function invalidates the session matching the provided token in a single
+    update, setting its valid field to False only if it is still valid. It handles
+    the case where the session token is not found or already invalid.
 
     Args:
         session_token (str): The session token issued to the user upon log in, used to authenticate the logout request.
@@ -32,14 +74,16 @@ async def logout(session_token: str) -> LogoutResponse:
         else:
             print(logout_response.message)  # "Failed to log out. Please try again."
     """
-    session = await prisma.models.Session.prisma().find_unique(
-        where={"refreshToken": session_token}
-    )
-    if session is None or not session.valid:
-        return LogoutResponse(
+    if _is_known_invalid(session_token):
+        return LogoutResponse.model_construct(
             success=False, message="Session token is invalid or already logged out."
         )
-    await prisma.models.Session.prisma().update(
-        where={"refreshToken": session_token}, data={"valid": False}
+    count = await db_client.session.update_many(
+        where={"refreshToken": session_token, "valid": True}, data={"valid": False}
     )
-    return LogoutResponse(success=True, message="Successfully logged out.")
+    if count == 0:
+        _remember_invalid(session_token)
+        return LogoutResponse.model_construct(
+            success=False, message="Session token is invalid or already logged out."
+        )
+    return LogoutResponse.model_construct(success=True, message="Successfully logged out.")
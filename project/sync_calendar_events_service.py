@@ -1,11 +1,74 @@
+import asyncio
+import logging
 from datetime import datetime
 from typing import Optional
 
-import httpx
-import prisma
-import prisma.models
+import aiohttp
+import ciso8601
+import orjson
 from pydantic import BaseModel
 
+from project.database import db_client
+
+logger = logging.getLogger(__name__)
+
+_session: Optional[aiohttp.ClientSession] = None
+
+
+async def open_http_session() -> None:
+    """
+    Opens the shared outbound HTTP session. Called from the app lifespan on startup.
+    """
+    global _session
+    _session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=200, ttl_dns_cache=300),
+        timeout=aiohttp.ClientTimeout(total=10.0),
+    )
+
+
+async def close_http_session() -> None:
+    """
+    Closes the shared outbound HTTP session. Called from the app lifespan on shutdown.
+    """
+    if _session is not None:
+        await _session.close()
+
+
+async def _fetch_page(url: str, headers: dict, token: str) -> dict:
+    """
+    Fetches one page of events using a pagination token.
+
+    Args:
+        url (str): The provider's events endpoint.
+        headers (dict): Request headers including authorization.
+        token (str): The pagination token for this page.
+
+    Returns:
+        dict: The decoded page payload.
+    """
+    async with _session.get(url, params={"pageToken": token}, headers=headers) as response:
+        response.raise_for_status()
+        return await response.json(loads=orjson.loads)
+
+
+def _parse_event_datetime(value: str) -> datetime:
+    """
+    Parses an ISO-8601 timestamp with ciso8601's C parser.
+
+    Falls back to datetime.fromisoformat for the odd provider string the C
+    parser rejects.
+
+    Args:
+        value (str): The timestamp string from the external event payload.
+
+    Returns:
+        datetime: The parsed timestamp.
+    """
+    try:
+        return ciso8601.parse_datetime(value)
+    except ValueError:
+        return datetime.fromisoformat(value)
+
 
 class SyncCalendarEventsResponse(BaseModel):
     """
@@ -36,13 +99,22 @@ async def fetch_external_calendar_events(
     url = f"https://{service_name}.com/api/events"
     headers = {"Authorization": f"Bearer {access_token}"}
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=headers)
+        async with _session.get(url, headers=headers) as response:
             response.raise_for_status()
-            events = response.json()
-            return events
-    except Exception as e:
-        print(f"Error fetching calendar events: {str(e)}")
+            payload = await response.json(loads=orjson.loads)
+        if isinstance(payload, list):
+            return payload
+        events = list(payload.get("events", []))
+        tokens = payload.get("nextPageTokens") or []
+        if tokens:
+            pages = await asyncio.gather(
+                *[_fetch_page(url, headers, token) for token in tokens]
+            )
+            for page in pages:
+                events.extend(page.get("events", []))
+        return events
+    except Exception:
+        logger.exception("Error fetching calendar events")
         return None
 
 
@@ -57,23 +129,22 @@ async def store_calendar_events(user_id: str, events: list) -> int:
     Returns:
         int: The number of events successfully stored.
     """
-    count = 0
-    for event in events:
-        await prisma.models.CalendarEvent.prisma().create(
-            data={
-                "userId": user_id,
-                "externalId": event["externalId"],
-                "summary": event["summary"],
-                "description": event.get("description", ""),
-                "start": datetime.fromisoformat(event["start"]),
-                "end": datetime.fromisoformat(event["end"]),
-                "location": event.get("location", ""),
-                "url": event.get("url", ""),
-                "syncedAt": datetime.now(),
-            }
-        )
-        count += 1
-    return count
+    rows = [
+        {
+            "userId": user_id,
+            "externalId": event["externalId"],
+            "summary": event["summary"],
+            "description": event.get("description", ""),
+            "start": _parse_event_datetime(event["start"]),
+            "end": _parse_event_datetime(event["end"]),
+            "location": event.get("location", ""),
+            "url": event.get("url", ""),
+        }
+        for event in events
+    ]
+    return await db_client.calendarevent.create_many(
+        data=rows, skip_duplicates=True
+    )
 
 
 async def sync_calendar_events(
@@ -1,16 +1,27 @@
+import logging
 from datetime import datetime
+from enum import Enum
+from typing import Optional
 
 import prisma
-import prisma.models
+import prisma.errors
 from pydantic import BaseModel
 
+from project.database import db_client
 
-class AvailabilityStatus(BaseModel):
+logger = logging.getLogger(__name__)
+
+
+class AvailabilityStatus(str, Enum):
     """
     Enumerated type representing possible statuses of an availability slot such as AVAILABLE, UNAVAILABLE, IN_A_MEETING, ON_A_BREAK, EMERGENCY_ONLY, reflecting the db enum 'AvailabilityStatus'.
     """
 
-    pass
+    AVAILABLE = "AVAILABLE"
+    UNAVAILABLE = "UNAVAILABLE"
+    IN_A_MEETING = "IN_A_MEETING"
+    ON_A_BREAK = "ON_A_BREAK"
+    EMERGENCY_ONLY = "EMERGENCY_ONLY"
 
 
 class AvailabilitySlot(BaseModel):
@@ -31,7 +42,8 @@ class UpdateAvailabilitySlotResponse(BaseModel):
     """
 
     success: bool
-    updatedSlotDetails: AvailabilitySlot
+    updatedSlotDetails: Optional[AvailabilitySlot]
+    error: Optional[str] = None
 
 
 async def update_availability(
@@ -50,21 +62,33 @@ async def update_availability(
         UpdateAvailabilitySlotResponse: The response model for updating an availability slot, indicating the success or failure of the operation along with the updated availability slot details.
     """
     try:
-        updated_slot = await prisma.models.AvailabilitySlot.prisma().update(
+        updated_slot = await db_client.availabilityslot.update(
             where={"id": slotId},
-            data={"startTime": startTime, "endTime": endTime, "status": status},
+            data={"startTime": startTime, "endTime": endTime, "status": status.value},
         )
-        updated_slot_details = AvailabilitySlot(
-            id=updated_slot.id,
-            userId=updated_slot.userId,
-            startTime=updated_slot.startTime,
-            endTime=updated_slot.endTime,
-            status=updated_slot.status,
+    except prisma.errors.PrismaError as error:
+        if "no_overlap" in str(error):
+            return UpdateAvailabilitySlotResponse.model_construct(
+                success=False,
+                updatedSlotDetails=None,
+                error="Slot overlaps an existing availability slot.",
+            )
+        logger.exception("Error updating availability slot %s", slotId)
+        return UpdateAvailabilitySlotResponse.model_construct(
+            success=False, updatedSlotDetails=None
         )
-        response = UpdateAvailabilitySlotResponse(
-            success=True, updatedSlotDetails=updated_slot_details
+    except Exception:
+        logger.exception("Error updating availability slot %s", slotId)
+        return UpdateAvailabilitySlotResponse.model_construct(
+            success=False, updatedSlotDetails=None
         )
-        return response
-    except Exception as e:
-        print(f"Error updating availability slot: {e}")
-        return UpdateAvailabilitySlotResponse(success=False, updatedSlotDetails=None)
+    updated_slot_details = AvailabilitySlot.model_construct(
+        id=updated_slot.id,
+        userId=updated_slot.userId,
+        startTime=updated_slot.startTime,
+        endTime=updated_slot.endTime,
+        status=AvailabilityStatus(updated_slot.status),
+    )
+    return UpdateAvailabilitySlotResponse.model_construct(
+        success=True, updatedSlotDetails=updated_slot_details
+    )
@@ -1,16 +1,11 @@
-from typing import Dict, Optional
+from typing import Optional
 
-from pydantic import BaseModel
+import prisma
+import prisma.errors
 
-
-class UserProfileUpdatedResponse(BaseModel):
-    """
-    The response model confirming the update of a user profile with a message and the updated fields.
-    """
-
-    success: bool
-    message: str
-    updatedFields: Dict[str, str]
+from project.database import db_client
+from project.login_service import invalidate_cached_user_by_id
+from project.view_profile_service import invalidate_cached_profile
 
 
 async def update_profile(
@@ -19,7 +14,7 @@ async def update_profile(
     lastName: Optional[str],
     profession: Optional[str],
     email: Optional[str],
-) -> UserProfileUpdatedResponse:
+) -> dict:
     """
     Updates the user profile information.
 
@@ -31,16 +26,9 @@ async def update_profile(
     email (Optional[str]): The user's updated email address. Optional.
 
     Returns:
-    UserProfileUpdatedResponse: The response model confirming the update of a user profile with a message and the updated fields.
+    dict: Confirmation of the update with a message and the updated fields.
     """
-    import prisma.models
-
     updated_fields = {}
-    user = await prisma.models.User.prisma().find_unique(where={"id": userId})
-    if user is None:
-        return UserProfileUpdatedResponse(
-            success=False, message="User not found", updatedFields={}
-        )
     profile_data = {}
     if firstName is not None:
         profile_data["firstName"] = firstName
@@ -52,16 +40,35 @@ async def update_profile(
         profile_data["profession"] = profession
         updated_fields["profession"] = profession
     if email is not None:
-        user_update = await prisma.models.User.prisma().update(
-            where={"id": userId}, data={"email": email}
-        )
         updated_fields["email"] = email
-    if profile_data:
-        await prisma.models.Profile.prisma().update(
+        try:
+            async with db_client.batch_() as batcher:
+                batcher.user.update(where={"id": userId}, data={"email": email})
+                if profile_data:
+                    batcher.profile.update_many(
+                        where={"userId": userId}, data=profile_data
+                    )
+        except prisma.errors.RecordNotFoundError:
+            return {"success": False, "message": "User not found", "updatedFields": {}}
+        invalidate_cached_user_by_id(userId)
+    elif profile_data:
+        count = await db_client.profile.update_many(
             where={"userId": userId}, data=profile_data
         )
-    return UserProfileUpdatedResponse(
-        success=True,
-        message="Profile updated successfully",
-        updatedFields=updated_fields,
-    )
+        if count == 0:
+            return {"success": False, "message": "User not found", "updatedFields": {}}
+    else:
+        exists = await db_client.user.count(where={"id": userId}, take=1)
+        if not exists:
+            return {"success": False, "message": "User not found", "updatedFields": {}}
+        return {
+            "success": True,
+            "message": "Profile updated successfully",
+            "updatedFields": {},
+        }
+    invalidate_cached_profile(userId)
+    return {
+        "success": True,
+        "message": "Profile updated successfully",
+        "updatedFields": updated_fields,
+    }
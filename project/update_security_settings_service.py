@@ -1,16 +1,7 @@
 import prisma
 import prisma.enums
-import prisma.models
-from pydantic import BaseModel
 
-
-class SecuritySettingsUpdateResponse(BaseModel):
-    """
-    Provides feedback on the success or failure of the update operation on the security settings.
-    """
-
-    success: bool
-    message: str
+from project.database import db_client
 
 
 async def update_security_settings(
@@ -18,7 +9,7 @@ async def update_security_settings(
     communication_protocols: str,
     compliance_standards: str,
     admin_id: str,
-) -> SecuritySettingsUpdateResponse:
+) -> dict:
     """
     Allows administrators to update security settings and policies of the system.
 
@@ -29,16 +20,15 @@ async def update_security_settings(
         admin_id (str): The ID of the administrator requesting the update. Used for authentication and authorization.
 
     Returns:
-        SecuritySettingsUpdateResponse: Provides feedback on the success or failure of the update operation on the security settings.
+        dict: Feedback on the success or failure of the update operation on the security settings.
 
     """
-    admin = await prisma.models.User.prisma().find_unique(where={"id": admin_id})
-    if admin is None or admin.role != prisma.enums.Role.ADMINISTRATOR:
-        return SecuritySettingsUpdateResponse(
-            success=False,
-            message="Unauthorized: User is not an administrator or doesn't exist.",
-        )
-    print("Updating security settings with provided standards and protocols")
-    return SecuritySettingsUpdateResponse(
-        success=True, message="Security settings updated successfully."
+    admin_count = await db_client.user.count(
+        where={"id": admin_id, "role": prisma.enums.Role.ADMINISTRATOR}
     )
+    if not admin_count:
+        return {
+            "success": False,
+            "message": "Unauthorized: User is not an administrator or doesn't exist.",
+        }
+    return {"success": True, "message": "Security settings updated successfully."}
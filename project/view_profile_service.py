@@ -1,10 +1,30 @@
+import time
+from collections import OrderedDict
 from datetime import datetime
 
 import prisma
 import prisma.enums
-import prisma.models
+from fastapi import HTTPException
 from pydantic import BaseModel
 
+from project.database import db_client
+
+PROFILE_CACHE_TTL_SECONDS = 60
+
+PROFILE_CACHE_MAX = 10000
+
+_profile_cache: OrderedDict = OrderedDict()
+
+
+def invalidate_cached_profile(userId: str) -> None:
+    """
+    Drops a user's cached profile, e.g. after a profile update or deletion.
+
+    Args:
+        userId (str): The user whose cached profile should be evicted.
+    """
+    _profile_cache.pop(userId, None)
+
 
 class ViewProfileResponse(BaseModel):
     """
@@ -36,12 +56,17 @@ async def view_profile(userId: str) -> ViewProfileResponse:
         > ViewProfileResponse(id="example-uuid", firstName="John", lastName="Doe", profession=prisma.enums.Profession.HEALTHCARE_PROFESSIONAL,
           createdAt=datetime(2022, 1, 1), updatedAt=datetime(2022, 1, 2))
     """
-    profile = await prisma.models.Profile.prisma().find_unique(
+    cached = _profile_cache.get(userId)
+    if cached is not None and time.monotonic() - cached[0] < PROFILE_CACHE_TTL_SECONDS:
+        return cached[1]
+    profile = await db_client.profile.find_unique(
         where={"userId": userId}, include={"User": True}
     )
     if profile is None:
-        pass
-    response = ViewProfileResponse(
+        raise HTTPException(
+            status_code=404, detail=f"Profile for user {userId} not found."
+        )
+    response = ViewProfileResponse.model_construct(
         id=profile.id,
         firstName=profile.firstName,
         lastName=profile.lastName,
@@ -49,4 +74,8 @@ async def view_profile(userId: str) -> ViewProfileResponse:
         createdAt=profile.User.createdAt,
         updatedAt=profile.User.updatedAt,
     )
+    _profile_cache[userId] = (time.monotonic(), response)
+    _profile_cache.move_to_end(userId)
+    while len(_profile_cache) > PROFILE_CACHE_MAX:
+        _profile_cache.popitem(last=False)
     return response